@@ -6,11 +6,191 @@ See the "Sharemind" academic paper (Bogdanov et al., 2008) for more details.
 Author: Ofek Zeevi
 """
 from __future__ import annotations
+import operator
 import random
-import math
 from typing import Iterable, Optional
 
+import numpy as np
+from numba import njit, prange
+
 DEFAULT_SIZE = 32
+MAX_FIXED_WIDTH_SIZE = 64  # The largest share size that still fits into a native (uint64) integer.
+
+
+def _share_dtype(size: int):
+    """
+    :param size: The size of each share in bits.
+    :return: The numpy dtype used when stacking shares of the given size into arrays. Shares of up to 64 bits are
+             stored as native uint64 values (and wrap around naturally), while larger shares fall back to plain
+             Python ints.
+    """
+    return np.uint64 if size <= MAX_FIXED_WIDTH_SIZE else object
+
+
+_rng = np.random.default_rng()
+
+
+def _random_ring_elements(count: int, size: int) -> list[int]:
+    """
+    Draws a few uniformly random elements of the ring Z_2^size. This is used for the handful of values needed by a
+    single protocol invocation, where per-element getrandbits calls are cheaper than a numpy call.
+
+    :param count: The number of random elements to draw.
+    :param size: The size of each element in bits.
+    :return: The random elements, as plain Python ints.
+    """
+    return [random.getrandbits(size) for _ in range(count)]
+
+
+def _random_ring_array(count: int, size: int) -> np.ndarray:
+    """
+    Draws a large batch of uniformly random elements of the ring Z_2^size, in a single numpy call.
+
+    :param count: The number of random elements to draw.
+    :param size: The size of each element in bits (at most MAX_FIXED_WIDTH_SIZE).
+    :return: The random elements, as a uint64 array.
+    """
+    return _rng.integers(0, 2 ** size, size=count, dtype=np.uint64)
+
+
+_CLA_SCHEDULE: dict[int, np.ndarray] = {}
+
+
+def _cla_schedule(size: int) -> np.ndarray:
+    """
+    Lists the index pairs updated by the carry look-ahead algorithm (see "SharemindSecret.bitwise_addition"). These
+    only depend on the size, so they're computed once per size and cached.
+
+    :param size: The number of bits being added (must be a power of two).
+    :return: An (N, 2) int32 array of (i1, i2) pairs, in execution order. Each level of the algorithm is a contiguous
+             block of size / 2 pairs, which are independent of each other.
+    """
+    if size not in _CLA_SCHEDULE:
+        pairs = []
+        for k in range((size - 1).bit_length()):
+            step_k = 1 << k  # 2^k
+            step_k1 = step_k << 1  # 2^(k+1). In the paper there's a typo, the "k+1" brackets are missing.
+            for l in range(step_k):
+                for m in range(size // step_k1):
+                    i2 = step_k + step_k1 * m - 1
+                    pairs.append((i2 + 1 + l, i2))
+        schedule = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+        schedule.flags.writeable = False  # The cached schedule is shared between all callers.
+        _CLA_SCHEDULE[size] = schedule
+    return _CLA_SCHEDULE[size]
+
+
+MUL_RANDOM_COUNT = 15  # 12 values for the multiplication protocol itself, and 3 for re-sharing its result.
+
+
+@njit(cache=True)
+def _re_share_kernel(u_sh: np.ndarray, rands: np.ndarray, mask: np.uint64) -> np.ndarray:
+    """
+    The re-sharing protocol from "SharemindSecret.re_share", operating directly on raw uint64 shares.
+
+    :param u_sh: The 3 shares to re-distribute.
+    :param rands: 3 random values modulo 2^size.
+    :param mask: The bit-mask 2^size - 1.
+    :return: The 3 new shares.
+    """
+    w_sh = np.empty(3, dtype=np.uint64)
+    w_sh[0] = (u_sh[0] + rands[2] - rands[0]) & mask
+    w_sh[1] = (u_sh[1] + rands[0] - rands[1]) & mask
+    w_sh[2] = (u_sh[2] + rands[1] - rands[2]) & mask
+    return w_sh
+
+
+@njit(cache=True)
+def _mpc_mul_kernel(u_sh: np.ndarray, v_sh: np.ndarray, rands: np.ndarray, mask: np.uint64) -> np.ndarray:
+    """
+    The multiplication protocol from "SharemindSecret.__mul__", operating directly on raw uint64 shares.
+    All intermediate values wrap around modulo 2^64, which is fine since 2^size divides 2^64.
+
+    :param u_sh: The 3 shares of the first secret.
+    :param v_sh: The 3 shares of the second secret.
+    :param rands: MUL_RANDOM_COUNT random values modulo 2^size.
+    :param mask: The bit-mask 2^size - 1.
+    :return: The 3 (re-shared) shares of the multiplication result.
+    """
+    u1, u2, u3 = u_sh[0], u_sh[1], u_sh[2]
+    v1, v2, v3 = v_sh[0], v_sh[1], v_sh[2]
+
+    # Round 1
+    r12, r13, s12, s13 = rands[0], rands[1], rands[2], rands[3]
+    r23, r21, s23, s21 = rands[4], rands[5], rands[6], rands[7]
+    r31, r32, s31, s32 = rands[8], rands[9], rands[10], rands[11]
+
+    # Round 2
+    a12 = u1 + r31
+    b12 = v1 + s31
+    a13 = u1 + r21
+    b13 = v1 + s21
+    a23 = u2 + r12
+    b23 = v2 + s12
+    a21 = u2 + r32
+    b21 = v2 + s32
+    a31 = u3 + r23
+    b31 = v3 + s23
+    a32 = u3 + r13
+    b32 = v3 + s13
+
+    # Round 3
+    w_sh = np.empty(3, dtype=np.uint64)
+    c1 = u1 * b21 + u1 * b31 + v1 * a21 + v1 * a31 - a12 * b21 - b12 * a21 + r12 * s13 + s12 * r13
+    w_sh[0] = (c1 + u1 * v1) & mask
+    c2 = u2 * b32 + u2 * b12 + v2 * a32 + v2 * a12 - a23 * b32 - b23 * a32 + r23 * s21 + s23 * r21
+    w_sh[1] = (c2 + u2 * v2) & mask
+    c3 = u3 * b13 + u3 * b23 + v3 * a13 + v3 * a23 - a31 * b13 - b31 * a13 + r31 * s32 + s31 * r32
+    w_sh[2] = (c3 + u3 * v3) & mask
+
+    return _re_share_kernel(w_sh, rands[12:15], mask)
+
+
+@njit(parallel=True, cache=True)
+def _bitwise_add_kernel(u_bits: np.ndarray, v_bits: np.ndarray, rands: np.ndarray, mask: np.uint64,
+                        schedule: np.ndarray) -> np.ndarray:
+    """
+    The carry look-ahead algorithm from "SharemindSecret.bitwise_addition", operating directly on raw uint64 shares.
+    The levels of the algorithm run one after the other, but the updates inside each level run in parallel.
+
+    :param u_bits: A (size, 3) array with the shares of each bit of the first number.
+    :param v_bits: A (size, 3) array with the shares of each bit of the second number.
+    :param rands: All the random values used by the algorithm - MUL_RANDOM_COUNT for each multiplication
+                  (size + 2 * len(schedule) of them), followed by 3 for re-sharing each output bit.
+    :param mask: The bit-mask 2^size - 1.
+    :param schedule: The carry look-ahead index pairs, as returned by "_cla_schedule".
+    :return: A (size, 3) array with the shares of each bit of the sum.
+    """
+    size = u_bits.shape[0]
+    two = np.uint64(2)
+
+    # Round 1
+    s_flags = np.empty((size, 3), dtype=np.uint64)
+    p_flags = np.empty((size, 3), dtype=np.uint64)
+    for i in prange(size):
+        s_flags[i] = _mpc_mul_kernel(u_bits[i], v_bits[i], rands[MUL_RANDOM_COUNT * i:MUL_RANDOM_COUNT * (i+1)], mask)
+        p_flags[i] = (u_bits[i] + v_bits[i] - two * s_flags[i]) & mask
+
+    # Round 2 ... log_2(n) + 1
+    pairs_per_level = max(size // 2, 1)
+    for level_start in range(0, schedule.shape[0], pairs_per_level):
+        for idx in prange(level_start, level_start + pairs_per_level):
+            i1, i2 = schedule[idx, 0], schedule[idx, 1]
+            # Every pair performs 2 multiplications, each using its own block of random values.
+            j = MUL_RANDOM_COUNT * (size + 2 * idx)
+            ps = _mpc_mul_kernel(p_flags[i1], s_flags[i2], rands[j:j + MUL_RANDOM_COUNT], mask)
+            s_flags[i1] = (s_flags[i1] + ps) & mask
+            p_flags[i1] = _mpc_mul_kernel(p_flags[i1], p_flags[i2],
+                                          rands[j + MUL_RANDOM_COUNT:j + 2 * MUL_RANDOM_COUNT], mask)
+
+    w_bits = np.empty((size, 3), dtype=np.uint64)
+    j = MUL_RANDOM_COUNT * (size + 2 * schedule.shape[0])
+    w_bits[0] = _re_share_kernel((u_bits[0] + v_bits[0] - two * s_flags[0]) & mask, rands[j:j + 3], mask)
+    for i in prange(1, size):
+        w_bits[i] = _re_share_kernel((u_bits[i] + v_bits[i] + s_flags[i-1] - two * s_flags[i]) & mask,
+                                     rands[j + 3 * i:j + 3 * (i+1)], mask)
+
+    return w_bits
 
 
 class SharemindSecret:
@@ -26,6 +206,8 @@ class SharemindSecret:
           calculations (both for efficiency and security reasons).
     """
 
+    __slots__ = ('size', 'mod', '_shares', '_mask', '_numeric_value')
+
     def __init__(self, value: Optional[int] = None, shares: Optional[Iterable] = None, size: int = DEFAULT_SIZE):
         """
         Create a new Sharemind secret. Either "value" or "shares" must be provided.
@@ -36,27 +218,69 @@ class SharemindSecret:
         """
         self.size = size
         self.mod = 2 ** size
+        self._mask = self.mod - 1
+        self._numeric_value: Optional[int] = None
 
         if value is not None:
-            assert 0 <= value < self.mod, 'Number provided is out of bounds'
-            self.shares = self.generate_shares(value, size)
+            try:
+                value = operator.index(value)
+            except TypeError:
+                raise ValueError('Number provided is not an integer') from None
+            if not 0 <= value < self.mod:
+                raise ValueError('Number provided is out of bounds')
+            self._numeric_value = value
+            shares = self.generate_shares(value, size)
         elif shares is not None:
-            shares = tuple(shares)
-            assert all(0 <= v < self.mod for v in shares), 'Not all shares provided are within the necessary bounds'
-            assert len(shares) == 3, 'Exactly 3 shares must be provided'
-            self.shares = shares
+            try:
+                shares = tuple(operator.index(v) for v in shares)
+            except TypeError:
+                raise ValueError('Not all shares provided are integers') from None
+            if len(shares) != 3:
+                raise ValueError('Exactly 3 shares must be provided')
+            if not all(0 <= v < self.mod for v in shares):
+                raise ValueError('Not all shares provided are within the necessary bounds')
         else:
             raise ValueError('Either shares or a numeric value must be provided')
 
+        self._shares = shares
+
+    @classmethod
+    def _from_validated_shares(cls, shares: tuple[int, int, int], size: int) -> SharemindSecret:
+        """
+        Creates a new Sharemind secret directly from a tuple of shares, skipping the validation done in "__init__".
+        This is meant for the results of this class' own computations, which are within bounds by construction.
+
+        :param shares: The 3 shares to be used by the new instance, as plain Python ints.
+        :param size: The size of each share in bits.
+        :return: The new instance.
+        """
+        w = cls.__new__(cls)
+        w.size = size
+        w.mod = 2 ** size
+        w._mask = w.mod - 1
+        w._numeric_value = None
+        w._shares = shares
+        return w
+
     def __repr__(self):
         return f'SharemindSecret(shares={self.shares}, size={self.size})'
 
+    @property
+    def shares(self) -> tuple[int, int, int]:
+        """
+        :return: The 3 shares of this secret, as plain Python ints.
+        """
+        return self._shares
+
     @property
     def numeric_value(self):
         """
         :return: The plain value represented by the shares of this secret.
         """
-        return sum(self.shares) % self.mod
+        # The shares are only ever changed by "re_share" (which preserves their sum), so this is computed only once.
+        if self._numeric_value is None:
+            self._numeric_value = sum(self._shares) & self._mask
+        return self._numeric_value
 
     @staticmethod
     def generate_shares(value: int, size: int = DEFAULT_SIZE) -> tuple[int, int, int]:
@@ -67,9 +291,8 @@ class SharemindSecret:
         :param size: The size of each share in bits.
         :return: The 3 generated shares.
         """
-        mod = 2 ** size
-        a, b = (random.randint(0, mod - 1) for _ in range(2))
-        c = (value - a - b) % mod
+        a, b = _random_ring_elements(2, size)
+        c = (value - a - b) & (2 ** size - 1)
         return a, b, c
 
     def re_share(self):
@@ -78,15 +301,12 @@ class SharemindSecret:
         This operation should be used at the end of non-universally-composable operations, to avoid accidentally
         leaking information about the original shares' distribution.
         """
-        u1, u2, u3 = self.shares
-
-        r1, r2, r3 = (random.randint(0, self.mod - 1) for _ in range(3))
-
-        w1 = (u1 + r3 - r1) % self.mod
-        w2 = (u2 + r1 - r2) % self.mod
-        w3 = (u3 + r2 - r3) % self.mod
-
-        self.shares = (w1, w2, w3)
+        # Party i adds r_(i-1) (mod 3) and subtracts r_i, so the r values cancel out in the sum (and the cached
+        # numeric value stays valid).
+        u1, u2, u3 = self._shares
+        r1, r2, r3 = _random_ring_elements(3, self.size)
+        mask = self._mask
+        self._shares = ((u1 + r3 - r1) & mask, (u2 + r1 - r2) & mask, (u3 + r2 - r3) & mask)
 
     @classmethod
     def from_binary_shares(cls, shares: Iterable, size: int = DEFAULT_SIZE) -> SharemindSecret:
@@ -102,14 +322,12 @@ class SharemindSecret:
         :return: The new instance, representing the same plain value as the provided shares.
         """
         u = SharemindSecret(shares=shares, size=size)
-        mod = 2 ** size
+        mask = u._mask
 
         # Round 1
-        r12, r13, s12, s13 = (random.randint(0, mod - 1) for _ in range(4))
+        r12, r13, s12, s13, r23, r21, s23, s21, r31, r32, s31, s32 = _random_ring_elements(12, size)
         s1 = r12 * r13 - s12 - s13
-        r23, r21, s23, s21 = (random.randint(0, mod - 1) for _ in range(4))
         s2 = r23 * r21 - s23 - s21
-        r31, r32, s31, s32 = (random.randint(0, mod - 1) for _ in range(4))
         s3 = r31 * r32 - s31 - s32
 
         # Round 2
@@ -127,25 +345,47 @@ class SharemindSecret:
         ab1 = s31 - r31 * b21
         ab2 = b12 * b21 + s32 - b12 * r32
         ab3 = s3
-        ab = SharemindSecret(shares=(ab1 % mod, ab2 % mod, ab3 % mod), size=size)
+        ab_shares = (ab1 & mask, ab2 & mask, ab3 & mask)
 
         ac1 = b31 * b13 + s21 - b31 * r21
         ac2 = s2
         ac3 = s23 - r23 * b13
-        ac = SharemindSecret(shares=(ac1 % mod, ac2 % mod, ac3 % mod), size=size)
+        ac_shares = (ac1 & mask, ac2 & mask, ac3 & mask)
 
         bc1 = s1
         bc2 = s12 - r12 * b32
         bc3 = b23 * b32 + s13 - b23 * r13
-        bc = SharemindSecret(shares=(bc1 % mod, bc2 % mod, bc3 % mod), size=size)
+        bc_shares = (bc1 & mask, bc2 & mask, bc3 & mask)
 
-        abc = ab * c
+        abc = SharemindSecret._from_validated_shares(ab_shares, size) * c
 
         # Round 4
-        w = u - ab * 2 - ac * 2 - bc * 2 + abc * 4
+        # Equivalent to u - ab * 2 - ac * 2 - bc * 2 + abc * 4, computed locally with a single re-share at the end.
+        w_shares = tuple((ui - 2 * (abi + aci + bci) + 4 * abci) & mask
+                         for ui, abi, aci, bci, abci in zip(u._shares, ab_shares, ac_shares, bc_shares, abc._shares))
+        w = SharemindSecret._from_validated_shares(w_shares, size)
         w.re_share()
         return w
 
+    @classmethod
+    def from_public_bit(cls, bit: int, size: int = DEFAULT_SIZE) -> SharemindSecret:
+        """
+        Creates a new Sharemind secret from a publicly known bit. The result is equivalent to calling
+        "from_binary_shares" with the binary shares (bit, 0, 0), but without running the conversion protocol.
+
+        NOTE: Substituting u2 = u3 = 0 into the algebra of "from_binary_shares", the shares of ab, ac, bc and abc all
+              collapse into random sharings of 0 (e.g. ab = (s31 - r31 * r32, s32, r31 * r32 - s31 - s32)). So the
+              conversion only adds randomness to the shares (bit, 0, 0), which are already a valid sharing of the bit
+              over Z_2^size. The result is NOT re-shared - callers that need fresh randomness should use "re_share".
+
+        :param bit: The plain bit to represent (0 or 1).
+        :param size: The size of the new shares in bits.
+        :return: The new instance, representing the provided bit.
+        """
+        if bit not in (0, 1):
+            raise ValueError('The provided value is not a bit')
+        return cls._from_validated_shares((int(bit), 0, 0), size)
+
     @classmethod
     def generate_random_number_and_bits(cls, size: int = DEFAULT_SIZE) -> tuple[SharemindSecret, list[SharemindSecret]]:
         """
@@ -163,13 +403,17 @@ class SharemindSecret:
                  and not plain values).
         """
         # Round 1
-        r_bits = [cls.from_binary_shares(shares=(random.randint(0, 1) for _ in range(3)), size=size)
-                  for _ in range(size)]
+        r_raw_bits = _rng.integers(0, 2, size=(size, 3), dtype=np.uint8)
+        r_bits = [cls.from_binary_shares(shares=raw_bit_shares, size=size) for raw_bit_shares in r_raw_bits.tolist()]
 
         # Round 2a (the second part of this round, 2b, is written in the "extract_bits" method.)
-        r = SharemindSecret(value=0, size=size)
-        for i, bit in enumerate(r_bits):
-            r += bit * (2 ** i)
+        # r = sum(r_bits[i] * 2^i), computed locally on all the shares at once.
+        dtype = _share_dtype(size)
+        r_bits_shares = np.array([bit._shares for bit in r_bits], dtype=dtype)
+        powers = 1 << np.arange(size, dtype=dtype)
+        r_shares = (r_bits_shares.T @ powers) & r_bits[0]._mask
+        r = SharemindSecret._from_validated_shares(tuple(r_shares.tolist()), size)
+        r.re_share()
 
         return r, r_bits
 
@@ -187,9 +431,15 @@ class SharemindSecret:
 
         # Round 3
         a_raw_value = a.numeric_value
-        a_raw_bits = [a_raw_value // (2 ** i) % 2 for i in range(self.size)]
+        a_raw_bytes = np.frombuffer(a_raw_value.to_bytes((self.size + 7) // 8, 'little'), dtype=np.uint8)
+        a_raw_bits = np.unpackbits(a_raw_bytes, bitorder='little')[:self.size].tolist()
 
-        a_bits = [self.from_binary_shares(shares=(raw_bit, 0, 0), size=self.size) for raw_bit in a_raw_bits]
+        """
+        NOTE: In the original paper, the bits of a are converted using the binary-to-arithmetic protocol (as in
+        "from_binary_shares"). However, a is public, so its bits can be shared directly. They aren't re-shared here
+        either, since "bitwise_addition" re-shares its output bits.
+        """
+        a_bits = [self.from_public_bit(raw_bit, size=self.size) for raw_bit in a_raw_bits]
 
         d_bits = self.bitwise_addition(a_bits, r_bits)
         return d_bits
@@ -205,32 +455,91 @@ class SharemindSecret:
         :return: The bits of the sum of the provided numbers, u+v (each represented as a Sharemind secret).
         """
         size = u_bits[0].size
-        assert len(u_bits) == len(v_bits) == size, 'Number of bits should be the same and match the defined share size'
-        assert all(u.size == size and v.size == size for u, v in zip(u_bits, v_bits)), \
-            'Not all bit secrets use the same share size'
+        if not len(u_bits) == len(v_bits) == size:
+            raise ValueError('Number of bits should be the same and match the defined share size')
+        if not all(u.size == size and v.size == size for u, v in zip(u_bits, v_bits)):
+            raise ValueError('Not all bit secrets use the same share size')
+        if size & (size - 1) != 0:
+            raise ValueError('size must be a power of two for carry look-ahead')
+
+        if size <= MAX_FIXED_WIDTH_SIZE:
+            return SharemindSecret._fixed_width_bitwise_addition(u_bits, v_bits)
 
         # Round 1
         """
         NOTE: In the original paper the "p_flags" initialization is defined twice, in contradictory ways. But based on 
         our understanding of the carry look-ahead algorithm, what follows is the correct initialization.
         """
+        mask = u_bits[0]._mask
+        u_shares = np.array([u._shares for u in u_bits], dtype=object)
+        v_shares = np.array([v._shares for v in v_bits], dtype=object)
+
         s_flags = [u * v for u, v in zip(u_bits, v_bits)]
-        p_flags = [u + v - s * 2 for u, v, s in zip(u_bits, v_bits, s_flags)]
+        s_shares = np.array([s._shares for s in s_flags], dtype=object)
+        p_flags = [SharemindSecret._from_validated_shares(tuple(p_sh), size)
+                   for p_sh in ((u_shares + v_shares - 2 * s_shares) & mask).tolist()]
 
         # Round 2 ... log_2(n) + 1
-        for k in range(0, int(math.log(size, 2))):
-            for l in range(0, 2**k):
-                for m in range(0, size // (2**(k+1))):  # In the paper there's a typo, the "k+1" brackets are missing.
-                    i1 = 2**k + l + 2**(k+1) * m
-                    i2 = 2**k + 2**(k+1) * m - 1
-                    s_flags[i1] = s_flags[i1] + p_flags[i1] * s_flags[i2]
-                    p_flags[i1] = p_flags[i1] * p_flags[i2]
-
-        w_bits = ([u_bits[0] + v_bits[0] - s_flags[0] * 2] +
-                  [u_bits[i] + v_bits[i] + s_flags[i-1] - s_flags[i] * 2 for i in range(1, size)])
+        for i1, i2 in _cla_schedule(size).tolist():
+            s_flags[i1] = s_flags[i1]._local_add(p_flags[i1] * s_flags[i2])
+            p_flags[i1] = p_flags[i1] * p_flags[i2]
+
+        # w_i = u_i + v_i + s_(i-1) - 2 * s_i, where there's no carry into the first bit.
+        s_shares = np.array([s._shares for s in s_flags], dtype=object)
+        carry_shares = np.zeros_like(s_shares)
+        carry_shares[1:] = s_shares[:-1]
+        w_bits = [SharemindSecret._from_validated_shares(tuple(w_sh), size)
+                  for w_sh in ((u_shares + v_shares + carry_shares - 2 * s_shares) & mask).tolist()]
+        for w in w_bits:
+            w.re_share()
 
         return w_bits
 
+    @staticmethod
+    def _fixed_width_bitwise_addition(u_bits: list[SharemindSecret],
+                                      v_bits: list[SharemindSecret]) -> list[SharemindSecret]:
+        """
+        The same algorithm as "bitwise_addition", but JIT-compiled and operating on raw uint64 shares.
+        Only usable for shares of up to MAX_FIXED_WIDTH_SIZE bits.
+        """
+        size = u_bits[0].size
+        schedule = _cla_schedule(size)
+        rand_count = MUL_RANDOM_COUNT * (size + 2 * len(schedule)) + 3 * size
+        rands = _random_ring_array(rand_count, size)
+
+        u_shares = np.array([u._shares for u in u_bits], dtype=np.uint64)
+        v_shares = np.array([v._shares for v in v_bits], dtype=np.uint64)
+        w_bits = _bitwise_add_kernel(u_shares, v_shares, rands, np.uint64(u_bits[0]._mask), schedule)
+        return [SharemindSecret._from_validated_shares(tuple(w_sh), size) for w_sh in w_bits.tolist()]
+
+    def _local_add(self, other: SharemindSecret) -> SharemindSecret:
+        """
+        Same as "__add__", but without re-sharing the result. Each party can compute its share of the result locally,
+        so this is meant for intermediate values of larger algorithms, which re-share their final result anyway.
+        """
+        u1, u2, u3 = self._shares
+        v1, v2, v3 = other._shares
+        mask = self._mask
+        return SharemindSecret._from_validated_shares(((u1 + v1) & mask, (u2 + v2) & mask, (u3 + v3) & mask), self.size)
+
+    def _local_sub(self, other: SharemindSecret) -> SharemindSecret:
+        """
+        Same as "__sub__", but without re-sharing the result (see "_local_add").
+        """
+        u1, u2, u3 = self._shares
+        v1, v2, v3 = other._shares
+        mask = self._mask
+        return SharemindSecret._from_validated_shares(((u1 - v1) & mask, (u2 - v2) & mask, (u3 - v3) & mask), self.size)
+
+    def _local_mul(self, other: int) -> SharemindSecret:
+        """
+        Same as "__mul__" with a plain value, but without re-sharing the result (see "_local_add").
+        """
+        u1, u2, u3 = self._shares
+        mask = self._mask
+        return SharemindSecret._from_validated_shares(((u1 * other) & mask, (u2 * other) & mask, (u3 * other) & mask),
+                                                      self.size)
+
     def __add__(self, other: SharemindSecret) -> SharemindSecret:
         """
         Perform addition between this secret and another secret.
@@ -238,8 +547,9 @@ class SharemindSecret:
         :param other: The other secret, to be added with this one.
         :return: The result of the addition, as a Sharemind secret.
         """
-        assert self.size == other.size, 'Cannot perform addition with different sizes'
-        w = SharemindSecret(shares=((u + v) % self.mod for u, v in zip(self.shares, other.shares)), size=self.size)
+        if self.size != other.size:
+            raise ValueError('Cannot perform addition with different sizes')
+        w = self._local_add(other)
         w.re_share()
         return w
 
@@ -250,8 +560,9 @@ class SharemindSecret:
         :param other: The other secret, to be subtracted from this one.
         :return: The result of the subtraction, as a Sharemind secret.
         """
-        assert self.size == other.size, 'Cannot perform subtraction with different sizes'
-        w = SharemindSecret(shares=((u - v) % self.mod for u, v in zip(self.shares, other.shares)), size=self.size)
+        if self.size != other.size:
+            raise ValueError('Cannot perform subtraction with different sizes')
+        w = self._local_sub(other)
         w.re_share()
         return w
 
@@ -263,19 +574,19 @@ class SharemindSecret:
         :return: The result of the multiplication, as a Sharemind secret.
         """
         if isinstance(other, int):
-            w = SharemindSecret(shares=((u * other) % self.mod for u in self.shares), size=self.size)
+            w = self._local_mul(other)
             w.re_share()
             return w
 
-        assert self.size == other.size, 'Cannot perform multiplication with different sizes'
+        if self.size != other.size:
+            raise ValueError('Cannot perform multiplication with different sizes')
 
-        u1, u2, u3 = self.shares
-        v1, v2, v3 = other.shares
+        mask = self._mask
+        u1, u2, u3 = self._shares
+        v1, v2, v3 = other._shares
 
         # Round 1
-        r12, r13, s12, s13 = (random.randint(0, self.mod - 1) for _ in range(4))
-        r23, r21, s23, s21 = (random.randint(0, self.mod - 1) for _ in range(4))
-        r31, r32, s31, s32 = (random.randint(0, self.mod - 1) for _ in range(4))
+        r12, r13, s12, s13, r23, r21, s23, s21, r31, r32, s31, s32 = _random_ring_elements(12, self.size)
 
         # Round 2
         a12 = u1 + r31
@@ -293,13 +604,13 @@ class SharemindSecret:
 
         # Round 3
         c1 = u1 * b21 + u1 * b31 + v1 * a21 + v1 * a31 - a12 * b21 - b12 * a21 + r12 * s13 + s12 * r13
-        w1 = (c1 + u1 * v1) % self.mod
+        w1 = (c1 + u1 * v1) & mask
         c2 = u2 * b32 + u2 * b12 + v2 * a32 + v2 * a12 - a23 * b32 - b23 * a32 + r23 * s21 + s23 * r21
-        w2 = (c2 + u2 * v2) % self.mod
+        w2 = (c2 + u2 * v2) & mask
         c3 = u3 * b13 + u3 * b23 + v3 * a13 + v3 * a23 - a31 * b13 - b31 * a13 + r31 * s32 + s31 * r32
-        w3 = (c3 + u3 * v3) % self.mod
+        w3 = (c3 + u3 * v3) & mask
 
-        w = SharemindSecret(shares=(w1, w2, w3), size=self.size)
+        w = SharemindSecret._from_validated_shares((w1, w2, w3), self.size)
         w.re_share()
         return w
 
@@ -315,7 +626,8 @@ class SharemindSecret:
         :param other: The other secret, to be compared with this one.
         :return: The result of the GTE comparison, as a Sharemind secret.
         """
-        assert self.size == other.size, 'Cannot perform greater-than-equals comparison between different sizes'
+        if self.size != other.size:
+            raise ValueError('Cannot perform greater-than-equals comparison between different sizes')
 
         d = self - other
         d_bits = d.extract_bits()
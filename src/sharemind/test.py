@@ -3,7 +3,30 @@ from tqdm import tqdm
 from sharemind import SharemindSecret
 
 
+def check_invalid_inputs():
+    invalid_inputs = {
+        'out-of-range value': lambda: SharemindSecret(value=2**8, size=8),
+        'non-integer value': lambda: SharemindSecret(value=2.9, size=8),
+        'non-integer share': lambda: SharemindSecret(shares=(2.9, 0, 0), size=8),
+        'string share': lambda: SharemindSecret(shares=('7', 0, 0), size=8),
+        'wrong share count': lambda: SharemindSecret(shares=(1, 2), size=8),
+        'out-of-range share': lambda: SharemindSecret(shares=(1, 2, 2**8), size=8),
+        'non-bit public bit': lambda: SharemindSecret.from_public_bit(300, size=8),
+        'mismatched sizes': lambda: SharemindSecret(value=1, size=8) + SharemindSecret(value=1, size=16),
+        'non-power-of-two size in GTE': lambda: SharemindSecret(value=1, size=12) >= SharemindSecret(value=1, size=12),
+    }
+    for name, create in invalid_inputs.items():
+        try:
+            create()
+        except ValueError:
+            print(f'Got the expected ValueError for {name}')
+        else:
+            print(f'Failed to raise a ValueError for {name}')
+
+
 def main():
+    check_invalid_inputs()
+
     for n in [8, 16, 32, 64]:
         count = 0
         for _ in tqdm(range(1000)):